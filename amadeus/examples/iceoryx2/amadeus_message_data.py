@@ -13,9 +13,81 @@
 """Amadeus message data type for iceoryx2 Python binding."""
 
 import ctypes
+import functools
 import json
+import struct
 import time
 
+# Bound once so the per-message timestamp avoids the module attribute lookup
+_time_ns = time.time_ns
+
+# Exceptions raised by _json_loads for malformed payloads
+_JSON_DECODE_ERRORS = (ValueError,)
+
+# The payload stays JSON text on the wire: the Rust dispatcher parses it with
+# serde_json. Only the Python-side codec is swappable.
+try:
+    # orjson serializes straight to UTF-8 bytes in C and parses bytes directly
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        # Keep json.dumps' handling of int/float/bool/None dict keys
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        # msgspec's JSON codec is the next fastest C implementation
+        import msgspec
+
+        _json_dumps = msgspec.json.Encoder().encode
+        _json_loads = msgspec.json.Decoder().decode
+        _JSON_DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+    except ImportError:
+        def _json_dumps(obj) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        _json_loads = json.loads
+
+# Human-readable priority names, indexed by the priority field
+_PRIORITY_NAMES = ("Low", "Normal", "High", "Critical")
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_type(message_type: str) -> bytes:
+    """Encode a message type once; the same few types are sent repeatedly."""
+    return message_type.encode('utf-8')
+
+
+def _pack(buffer, msg_type_bytes: bytes, json_bytes: bytes, priority: int, timestamp: int):
+    """Validate the encoded fields and pack them into an AmadeusMessageData buffer."""
+    # Validate message type (max 64 bytes)
+    if len(msg_type_bytes) > 64:
+        raise ValueError("Message type too long (max 64 bytes)")
+
+    # Validate JSON payload (max 4096 bytes)
+    if len(json_bytes) > 4096:
+        raise ValueError("JSON payload too long (max 4096 bytes)")
+
+    # Validate priority (unsigned byte)
+    if not isinstance(priority, int) or not 0 <= priority <= 0xFF:
+        raise ValueError("Priority must be an integer between 0 and 255")
+
+    # Auto-generate timestamp if not provided
+    if timestamp is None:
+        timestamp = _time_ns() // 1_000_000
+    elif not isinstance(timestamp, int) or not 0 <= timestamp <= 0xFFFF_FFFF_FFFF_FFFF:
+        raise ValueError("Timestamp must be an unsigned 64-bit integer (Unix ms)")
+
+    # One C-level call writes every field; the fixed-size strings are
+    # null padded by struct itself.
+    _LAYOUT.pack_into(
+        buffer, 0,
+        msg_type_bytes, len(msg_type_bytes),
+        json_bytes, len(json_bytes),
+        priority, timestamp
+    )
+
 
 class AmadeusMessageData(ctypes.Structure):
     """The strongly typed payload type for Amadeus messages.
@@ -48,40 +120,23 @@ class AmadeusMessageData(ctypes.Structure):
     ):
         """Initialize AmadeusMessageData with validation and padding."""
         super().__init__()
-
-        # Auto-generate timestamp if not provided
-        if timestamp is None:
-            timestamp = int(time.time() * 1000)
-
-        # Encode and validate message type (max 64 bytes)
-        msg_type_bytes = message_type.encode('utf-8')
-        if len(msg_type_bytes) > 64:
-            raise ValueError("Message type too long (max 64 bytes)")
-        self.message_type = msg_type_bytes.ljust(64, b'\x00')  # Pad with null bytes
-        self.message_type_len = len(msg_type_bytes)
-
-        # Encode and validate JSON payload (max 4096 bytes)
-        json_bytes = json_payload.encode('utf-8')
-        if len(json_bytes) > 4096:
-            raise ValueError("JSON payload too long (max 4096 bytes)")
-        self.json_data = json_bytes.ljust(4096, b'\x00')  # Pad with null bytes
-        self.json_data_len = len(json_bytes)
-
-        self.priority = priority
-        self.timestamp = timestamp
+        _pack(self, _encode_type(message_type), json_payload.encode('utf-8'), priority, timestamp)
 
     def get_message_type(self) -> str:
         """Extract message type string from padded buffer."""
-        return self.message_type[:self.message_type_len].decode('utf-8')
+        # The length comes from the sender; never read past the 64-byte field
+        return ctypes.string_at(ctypes.addressof(self) + _MT_OFF, min(self.message_type_len, 64)).decode('utf-8')
 
     def get_json_payload(self) -> str:
         """Extract JSON payload string from padded buffer."""
-        return self.json_data[:self.json_data_len].decode('utf-8')
+        # The length comes from the sender; never read past the 4096-byte field
+        return ctypes.string_at(ctypes.addressof(self) + _JD_OFF, min(self.json_data_len, 4096)).decode('utf-8')
 
     def get_priority_name(self) -> str:
         """Convert priority number to human-readable name."""
-        priorities = ["Low", "Normal", "High", "Critical"]
-        return priorities[self.priority] if 0 <= self.priority < len(priorities) else f"Unknown({self.priority})"
+        # priority is a c_uint8, so only the upper bound needs checking
+        p = self.priority
+        return _PRIORITY_NAMES[p] if p < 4 else f"Unknown({p})"
 
     def __str__(self) -> str:
         """Returns human-readable string of the contents."""
@@ -115,16 +170,115 @@ class AmadeusMessageData(ctypes.Structure):
         Returns:
             AmadeusMessageData instance
         """
-        json_payload = json.dumps(data, ensure_ascii=False)
-        return cls(message_type=message_type, json_payload=json_payload, priority=priority)
+        return cls.from_bytes(message_type, cls.encode_payload(data), priority)
+
+    @staticmethod
+    def encode_payload(data: dict) -> bytes:
+        """Serialize a dictionary to the UTF-8 JSON bytes stored in json_data."""
+        return _json_dumps(data)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        message_type: str,
+        json_bytes: bytes,
+        priority: int = 1,
+        timestamp: int = None
+    ) -> 'AmadeusMessageData':
+        """Create AmadeusMessageData from an already encoded JSON payload.
+
+        Args:
+            message_type: The message type
+            json_bytes: UTF-8 encoded JSON document
+            priority: Priority level
+            timestamp: Unix timestamp in milliseconds (defaults to now)
+
+        Returns:
+            AmadeusMessageData instance
+        """
+        return cls.new_raw(_encode_type(message_type), json_bytes, priority, timestamp)
+
+    @classmethod
+    def new_raw(
+        cls,
+        msg_type_bytes: bytes,
+        json_bytes: bytes,
+        priority: int = 1,
+        timestamp: int = None
+    ) -> 'AmadeusMessageData':
+        """Create AmadeusMessageData directly from encoded fields.
+
+        The fields are packed straight into the struct without going through
+        __init__ or a dict; all other constructors end up here.
+
+        Args:
+            msg_type_bytes: UTF-8 encoded message type
+            json_bytes: UTF-8 encoded JSON document
+            priority: Priority level
+            timestamp: Unix timestamp in milliseconds (defaults to now)
+
+        Returns:
+            AmadeusMessageData instance
+        """
+        message_data = cls.__new__(cls)
+        _pack(message_data, msg_type_bytes, json_bytes, priority, timestamp)
+        return message_data
+
+    @staticmethod
+    def write_into(
+        payload,
+        msg_type_bytes: bytes,
+        json_bytes: bytes,
+        priority: int = 1,
+        timestamp: int = None
+    ):
+        """Pack encoded fields directly into an existing payload buffer.
+
+        Intended for the payload of a loaned iceoryx2 sample: the message is
+        built in shared memory, so no intermediate instance is allocated and
+        no second copy is needed to publish it.
+
+        Args:
+            payload: Writable AmadeusMessageData-sized buffer
+            msg_type_bytes: UTF-8 encoded message type
+            json_bytes: UTF-8 encoded JSON document
+            priority: Priority level
+            timestamp: Unix timestamp in milliseconds (defaults to now)
+        """
+        _pack(payload, msg_type_bytes, json_bytes, priority, timestamp)
 
     def to_dict(self) -> dict:
         """Convert the JSON payload back to a dictionary.
 
+        Returns:
+            Dictionary representation of the JSON payload
+        """
+        # Both orjson and json parse bytes, so the raw slice is handed over
+        # without a decode/re-encode round trip.
+        return self.decode_payload(
+            ctypes.string_at(ctypes.addressof(self) + _JD_OFF, min(self.json_data_len, 4096))
+        )
+
+    @staticmethod
+    def decode_payload(json_bytes: bytes) -> dict:
+        """Parse JSON bytes extracted from json_data into a dictionary.
+
+        Args:
+            json_bytes: UTF-8 encoded JSON document
+
         Returns:
             Dictionary representation of the JSON payload
         """
         try:
-            return json.loads(self.get_json_payload())
-        except json.JSONDecodeError:
+            return _json_loads(json_bytes)
+        except _JSON_DECODE_ERRORS:
             return {"error": "Invalid JSON payload"}
+
+
+# Field offsets, cached to keep descriptor lookups out of the copy paths
+_MT_OFF = AmadeusMessageData.message_type.offset
+_JD_OFF = AmadeusMessageData.json_data.offset
+
+# Native alignment ('@') reproduces the #[repr(C)] padding of the Rust struct
+_LAYOUT = struct.Struct('@64sB4096sHBQ')
+assert _LAYOUT.size == ctypes.sizeof(AmadeusMessageData), "struct layout out of sync with _fields_"
@@ -22,14 +22,65 @@ Amadeus 综合功能测试套件
 
 import threading
 import time
-import json
-import statistics
-from typing import Dict, List, Any
+from array import array
+from typing import List, NamedTuple
 from dataclasses import dataclass
 from enum import Enum
 import iceoryx2 as iox2
 from amadeus_message_data import AmadeusMessageData
 
+# 排空接收队列时，连续多少次空轮询视为消息已处理完毕
+DRAIN_IDLE_POLLS = 3
+# 两次空轮询之间的间隔（秒）
+DRAIN_POLL_INTERVAL = 0.01
+
+# 性能测试中一次借出并批量发送的样本数
+PERF_BATCH_SIZE = 16
+
+# 性能测试负载的结构固定，直接按模板生成 JSON，省去每条消息的序列化。
+# 仅插入整数，无需转义。
+_PERF_PAYLOAD_TEMPLATE = '{{"sequence":{0},"data":"性能测试消息 {0}","batch_id":"perf_test_001"}}'
+
+# 监控与告警测试的负载固定不变，导入时预先序列化：(消息类型, JSON 字节[, 优先级])
+_MONITORING_MESSAGES = [
+    (msg_type.encode('utf-8'), AmadeusMessageData.encode_payload(payload))
+    for msg_type, payload in (
+        ("system.health_check", {"component": "all"}),
+        ("system.metrics", {"include": ["cpu", "memory", "disk"]}),
+        ("system.performance", {"duration": 60})
+    )
+]
+_ALERT_MESSAGES = [
+    (
+        msg_type.encode('utf-8'),
+        AmadeusMessageData.encode_payload({
+            "description": description,
+            "source": "python_test",
+            "severity": priority,
+            "action_required": priority >= 2
+        }),
+        priority
+    )
+    for msg_type, description, priority in (
+        ("notification.info", "信息", 0),
+        ("notification.warning", "警告", 1),
+        ("alert.high", "高优先级告警", 2),
+        ("alert.critical", "严重告警", 3)
+    )
+]
+
+
+class MessageColumns(NamedTuple):
+    """按列（SoA）存放的一批接收消息，数值列为紧凑的 array，可直接按列聚合"""
+    message_types: List[str]
+    priorities: array
+    timestamps: array
+    payloads: List[str]
+
+    @classmethod
+    def empty(cls) -> "MessageColumns":
+        return cls([], array('B'), array('Q'), [])
+
 
 class TestCategory(Enum):
     """测试类别枚举"""
@@ -69,7 +120,6 @@ class AmadeusSystemTester:
         self.publisher = None
         self.subscriber = None
         self.test_results: List[TestResult] = []
-        self.received_messages: List[Dict[str, Any]] = []
         self.setup_connection()
 
     def setup_connection(self):
@@ -88,7 +138,7 @@ class AmadeusSystemTester:
         )
 
         # 创建发布者和订阅者
-        self.publisher = service.publisher_builder().create()
+        self.publisher = service.publisher_builder().max_loaned_samples(PERF_BATCH_SIZE).create()
         self.subscriber = service.subscriber_builder().create()
 
         print("✅ 连接成功")
@@ -96,38 +146,71 @@ class AmadeusSystemTester:
     def send_message(self, message_type: str, payload: dict, priority: int = 1) -> bool:
         """发送消息"""
         try:
-            message_data = AmadeusMessageData.from_dict(message_type, payload, priority)
+            json_bytes = AmadeusMessageData.encode_payload(payload)
+        except Exception as e:
+            print(f"❌ 发送消息失败: {e}")
+            return False
 
-            # 使用零拷贝模式发送
+        return self.send_message_inplace(message_type.encode('utf-8'), json_bytes, priority)
+
+    def send_message_inplace(
+        self,
+        message_type: bytes,
+        json_bytes: bytes,
+        priority: int = 1,
+        timestamp: int = None
+    ) -> bool:
+        """直接在借出的共享内存样本中构造并发送消息"""
+        try:
+            # 使用零拷贝模式发送：字段直接写入共享内存，不经过 Python 堆上的中间对象
             sample = self.publisher.loan_uninit()
-            sample = sample.write_payload(message_data)
-            sample.send()
+            AmadeusMessageData.write_into(sample.payload, message_type, json_bytes, priority, timestamp)
+            sample.assume_init().send()
 
             return True
         except Exception as e:
             print(f"❌ 发送消息失败: {e}")
             return False
 
-    def receive_messages(self, timeout_seconds: float = 1.0) -> List[Dict[str, Any]]:
-        """接收消息"""
-        messages = []
-        start_time = time.time()
-
-        while time.time() - start_time < timeout_seconds:
-            sample = self.subscriber.receive()
+    def receive_batch_soa(self, timeout_seconds: float = 1.0, columns: MessageColumns = None) -> MessageColumns:
+        """按列接收消息，追加到 columns（未提供时新建）"""
+        if columns is None:
+            columns = MessageColumns.empty()
+        message_types, priorities, timestamps, payloads = columns
+        receive = self.subscriber.receive
+        now = time.monotonic_ns
+        deadline = now() + int(timeout_seconds * 1e9)
+
+        while now() < deadline:
+            sample = receive()
             if sample is None:
                 break
 
             message_data = sample.payload
-            message_dict = {
-                "message_type": message_data.get_message_type(),
-                "payload": message_data.to_dict(),
-                "priority": message_data.priority,
-                "timestamp": message_data.timestamp
-            }
-            messages.append(message_dict)
-
-        return messages
+            message_types.append(message_data.get_message_type())
+            payloads.append(message_data.get_json_payload())
+            priorities.append(message_data.priority)
+            timestamps.append(message_data.timestamp)
+
+        return columns
+
+    def drain_messages(self, timeout_seconds: float = 2.0, idle_polls: int = DRAIN_IDLE_POLLS) -> MessageColumns:
+        """按列接收消息，直到连续 idle_polls 次轮询均为空或超时"""
+        columns = MessageColumns.empty()
+        idle = 0
+        now = time.monotonic_ns
+        deadline = now() + int(timeout_seconds * 1e9)
+
+        while idle < idle_polls and now() < deadline:
+            received = len(columns.message_types)
+            self.receive_batch_soa((deadline - now()) / 1e9, columns)
+            if len(columns.message_types) > received:
+                idle = 0
+            else:
+                idle += 1
+                time.sleep(DRAIN_POLL_INTERVAL)
+
+        return columns
 
     def run_test(self, category: TestCategory, test_name: str, test_func) -> TestResult:
         """运行单个测试"""
@@ -143,17 +226,13 @@ class AmadeusSystemTester:
         )
 
         try:
-            # 清空之前接收的消息
-            self.received_messages.clear()
-
             # 运行测试函数
             test_func()
 
-            # 等待消息处理
-            time.sleep(0.5)
-            received = self.receive_messages(2.0)
+            # 等待消息处理：轮询直到队列连续多次为空
+            received = self.drain_messages(2.0)
 
-            result.message_count = len(received)
+            result.message_count = len(received.message_types)
             result.success = True
             result.end_time = time.time()
             result.latency_ms = (result.end_time - result.start_time) * 1000
@@ -179,7 +258,7 @@ class AmadeusSystemTester:
                     "test_id": i + 1,
                     "message": f"基础测试消息 #{i + 1}",
                     "source": "python_test",
-                    "timestamp": int(time.time() * 1000)
+                    "timestamp": time.time_ns() // 1_000_000
                 }
             )
             if not success:
@@ -215,7 +294,7 @@ class AmadeusSystemTester:
         # 保存数据
         self.send_message("storage.save", {
             "key": "test_key",
-            "value": {"data": "test_value", "timestamp": int(time.time() * 1000)},
+            "value": {"data": "test_value", "timestamp": time.time_ns() // 1_000_000},
             "ttl": 3600
         })
 
@@ -263,42 +342,20 @@ class AmadeusSystemTester:
         """测试监控系统"""
         print("  📊 测试系统监控...")
 
-        monitoring_tests = [
-            ("system.health_check", {"component": "all"}),
-            ("system.metrics", {"include": ["cpu", "memory", "disk"]}),
-            ("system.performance", {"duration": 60})
-        ]
-
-        for msg_type, payload in monitoring_tests:
-            success = self.send_message(msg_type, payload)
+        for msg_type, payload_bytes in _MONITORING_MESSAGES:
+            success = self.send_message_inplace(msg_type, payload_bytes)
             if not success:
-                raise Exception(f"发送监控消息失败: {msg_type}")
+                raise Exception(f"发送监控消息失败: {msg_type.decode('utf-8')}")
             time.sleep(0.1)
 
     def test_alert_system(self):
         """测试告警系统"""
         print("  🚨 测试告警系统...")
 
-        alerts = [
-            ("notification.info", "信息", 0),
-            ("notification.warning", "警告", 1),
-            ("alert.high", "高优先级告警", 2),
-            ("alert.critical", "严重告警", 3)
-        ]
-
-        for msg_type, description, priority in alerts:
-            success = self.send_message(
-                msg_type,
-                {
-                    "description": description,
-                    "source": "python_test",
-                    "severity": priority,
-                    "action_required": priority >= 2
-                },
-                priority
-            )
+        for msg_type, payload_bytes, priority in _ALERT_MESSAGES:
+            success = self.send_message_inplace(msg_type, payload_bytes, priority)
             if not success:
-                raise Exception(f"发送告警消息失败: {msg_type}")
+                raise Exception(f"发送告警消息失败: {msg_type.decode('utf-8')}")
 
     def test_external_integration(self):
         """测试外部系统集成"""
@@ -326,25 +383,31 @@ class AmadeusSystemTester:
 
         start_time = time.time()
         message_count = 100
-
-        # 发送批量消息
-        for i in range(message_count):
-            success = self.send_message(
-                "test.performance",
-                {
-                    "sequence": i,
-                    "data": f"性能测试消息 {i}",
-                    "batch_id": "perf_test_001"
-                }
-            )
-            if not success:
-                raise Exception(f"发送性能测试消息失败: {i}")
+        msg_type_bytes = b"test.performance"
+
+        # 分批发送：先一次性借出整批样本并就地填充，再集中发送
+        loan_uninit = self.publisher.loan_uninit
+        for batch_start in range(0, message_count, PERF_BATCH_SIZE):
+            batch = range(batch_start, min(batch_start + PERF_BATCH_SIZE, message_count))
+            try:
+                samples = [loan_uninit() for _ in batch]
+                for sample, i in zip(samples, batch):
+                    AmadeusMessageData.write_into(
+                        sample.payload,
+                        msg_type_bytes,
+                        _PERF_PAYLOAD_TEMPLATE.format(i).encode('utf-8')
+                    )
+                for sample in samples:
+                    sample.assume_init().send()
+            except Exception as e:
+                raise Exception(f"发送性能测试消息失败: 批次 {batch_start}: {e}")
 
         end_time = time.time()
         total_time = end_time - start_time
         msg_per_sec = message_count / total_time
 
-        print(".2f"
+        print(f"  📈 发送 {message_count} 条消息，耗时 {total_time:.2f}s，吞吐量 {msg_per_sec:.2f} msg/s")
+
     def run_all_tests(self):
         """运行所有测试"""
         print("🚀 开始Amadeus综合功能测试")
@@ -373,21 +436,28 @@ class AmadeusSystemTester:
         print("=" * 50)
 
         # 按类别分组统计
+        # 单次遍历累加耗时总和与极值，无需保留耗时列表再二次计算
         category_stats = {}
         total_tests = len(self.test_results)
         passed_tests = 0
+        passed_latency_sum = 0.0
+        passed_latency_min = float("inf")
+        passed_latency_max = 0.0
 
         for result in self.test_results:
             if result.success:
                 passed_tests += 1
+                passed_latency_sum += result.latency_ms
+                passed_latency_min = min(passed_latency_min, result.latency_ms)
+                passed_latency_max = max(passed_latency_max, result.latency_ms)
 
             if result.category not in category_stats:
-                category_stats[result.category] = {"total": 0, "passed": 0, "latencies": []}
+                category_stats[result.category] = {"total": 0, "passed": 0, "latency_sum": 0.0}
 
             category_stats[result.category]["total"] += 1
             if result.success:
                 category_stats[result.category]["passed"] += 1
-            category_stats[result.category]["latencies"].append(result.latency_ms)
+            category_stats[result.category]["latency_sum"] += result.latency_ms
 
         # 输出总体结果
         success_rate = (passed_tests / total_tests) * 100
@@ -399,18 +469,21 @@ class AmadeusSystemTester:
             passed = stats["passed"]
             total = stats["total"]
             rate = (passed / total) * 100
-            avg_latency = statistics.mean(stats["latencies"]) if stats["latencies"] else 0
-            print(".1f"
+            avg_latency = stats["latency_sum"] / total
+            print(f"  {category.value}: {passed}/{total} 通过 ({rate:.1f}%)，平均耗时 {avg_latency:.2f}ms")
+
         # 性能统计
-        all_latencies = [r.latency_ms for r in self.test_results if r.success]
-        if all_latencies:
-            print("
-性能统计:"            print(".2f"            print(".2f"            print(".2f"
+        if passed_tests:
+            print("\n性能统计:")
+            print(f"  平均耗时: {passed_latency_sum / passed_tests:.2f}ms")
+            print(f"  最短耗时: {passed_latency_min:.2f}ms")
+            print(f"  最长耗时: {passed_latency_max:.2f}ms")
+
         # 详细失败信息
         failed_tests = [r for r in self.test_results if not r.success]
         if failed_tests:
-            print("
-❌ 失败的测试:"            for result in failed_tests:
+            print("\n❌ 失败的测试:")
+            for result in failed_tests:
                 print(f"  - {result.category.value}.{result.test_name}: {result.error_message}")
 
         print("\n✅ 测试完成!")
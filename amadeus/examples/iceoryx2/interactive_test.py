@@ -19,10 +19,49 @@ Amadeus 交互式功能测试器
 import threading
 import time
 import json
-from typing import Dict, List, Any, Optional
+import queue
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, Any, Optional, Tuple, Union
 import iceoryx2 as iox2
 from amadeus_message_data import AmadeusMessageData
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# 消息历史最多保留的条数
+MESSAGE_HISTORY_SIZE = 10000
+
+# 基础消息测试单次最多发送的消息数，以及相邻两条之间的间隔
+BASIC_MESSAGE_MAX = 10
+BASIC_SEND_INTERVAL = iox2.Duration.from_millis(200)
+
+# 后台监控等待事件通知的最长时间；Rust 端不发通知，超时后仍会轮询一次
+MONITOR_CYCLE_TIME = iox2.Duration.from_millis(100)
+
+# 事件服务名后缀：发送方发送消息后在该服务上通知，唤醒监控线程
+EVENT_SERVICE_SUFFIX = "/Event"
+
+# 子菜单选项：(名称, 消息类型, 负载或负载工厂, 优先级)
+MenuItem = Tuple[str, str, Union[Dict[str, Any], Callable[[], Dict[str, Any]]], int]
+
+
+class MsgRecord:
+    """消息历史记录，使用 __slots__ 代替字典以减少内存和 GC 开销
+
+    timestamp 为 Unix 毫秒时间戳，与 AmadeusMessageData.timestamp 一致。
+    """
+    __slots__ = ("direction", "message_type", "payload", "priority", "timestamp")
+
+    def __init__(self, direction: str, message_type: str, payload: Dict[str, Any], priority: int, timestamp: int):
+        self.direction = direction
+        self.message_type = message_type
+        self.payload = payload
+        self.priority = priority
+        self.timestamp = timestamp
+
 
 class InteractiveTester:
     """交互式测试器"""
@@ -32,8 +71,32 @@ class InteractiveTester:
         self.node = None
         self.publisher = None
         self.subscriber = None
-        self.message_history: List[Dict[str, Any]] = []
+        self.notifier = None
+        self.listener = None
+        # 固定容量的环形缓冲区；message_total 记录累计条数，不受容量限制。
+        # 两者只由主线程写入，监控线程收到的消息经 _recv_queue 转交。
+        self.message_history: deque = deque(maxlen=MESSAGE_HISTORY_SIZE)
+        self.message_total = 0
+        self._recv_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # 监控线程只负责取空订阅队列并复制原始负载，解码交给解码线程
+        self._raw_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._decoder_thread: Optional[threading.Thread] = None
         self.monitoring_active = False
+        # 主菜单选项 -> 处理函数
+        self._dispatch: Dict[str, Callable[[], None]] = {
+            'h': self.show_help,
+            'help': self.show_help,
+            '0': self.toggle_monitoring,
+            '1': self.handle_basic_messaging,
+            '2': self.handle_plugin_system,
+            '3': self.handle_storage_operations,
+            '4': self.handle_scheduler_operations,
+            '5': self.handle_monitoring_system,
+            '6': self.handle_alert_system,
+            '7': self.handle_external_integration,
+            '8': self.handle_custom_message,
+            '9': self.show_message_history,
+        }
         self.setup_connection()
 
     def setup_connection(self):
@@ -53,6 +116,15 @@ class InteractiveTester:
             self.publisher = service.publisher_builder().create()
             self.subscriber = service.subscriber_builder().create()
 
+            # 事件服务：监控线程阻塞在 listener 上，有新消息时由 notifier 唤醒
+            event_service = (
+                self.node.service_builder(iox2.ServiceName.new(self.service_name + EVENT_SERVICE_SUFFIX))
+                .event()
+                .open_or_create()
+            )
+            self.notifier = event_service.notifier_builder().create()
+            self.listener = event_service.listener_builder().create()
+
             print("✅ 连接成功")
             return True
         except Exception as e:
@@ -62,47 +134,72 @@ class InteractiveTester:
     def send_message(self, message_type: str, payload: dict, priority: int = 1) -> bool:
         """发送消息"""
         try:
-            message_data = AmadeusMessageData.from_dict(message_type, payload, priority)
+            # 负载编码后直接写入借出的共享内存样本
+            json_bytes = AmadeusMessageData.encode_payload(payload)
             sample = self.publisher.loan_uninit()
-            sample = sample.write_payload(message_data)
-            sample.send()
-
-            # 记录到历史
-            self.message_history.append({
-                "direction": "sent",
-                "message_type": message_type,
-                "payload": payload,
-                "priority": priority,
-                "timestamp": time.time()
-            })
-
-            return True
+            AmadeusMessageData.write_into(sample.payload, message_type.encode('utf-8'), json_bytes, priority)
+            sample.assume_init().send()
+            self.notifier.notify()
         except Exception as e:
             print(f"❌ 发送消息失败: {e}")
             return False
 
-    def receive_messages(self, timeout_seconds: float = 0.1) -> List[Dict[str, Any]]:
-        """接收消息"""
-        messages = []
-        start_time = time.time()
+        self._record_sent(message_type, payload, priority)
+        return True
+
+    def _record_sent(self, message_type: str, payload: dict, priority: int):
+        """将已发送的消息记录到历史（先并入已收到的消息，保持先后顺序）"""
+        self._flush_received()
+        self._record(MsgRecord("sent", message_type, payload, priority, time.time_ns() // 1_000_000))
+
+    def receive_messages(self) -> int:
+        """接收消息：一次性取空订阅队列，返回收到的条数
+
+        样本在离开本函数后即归还给 iceoryx2，因此只复制一份原始负载交给
+        解码线程，JSON 解码不占用接收循环的时间。
+        """
+        receive = self.subscriber.receive
+        put = self._raw_queue.put
+        copy = AmadeusMessageData.from_buffer_copy
+        count = 0
 
-        while time.time() - start_time < timeout_seconds:
-            sample = self.subscriber.receive()
+        while True:
+            sample = receive()
             if sample is None:
                 break
 
-            message_data = sample.payload
-            message_dict = {
-                "direction": "received",
-                "message_type": message_data.get_message_type(),
-                "payload": message_data.to_dict(),
-                "priority": message_data.priority,
-                "timestamp": message_data.timestamp / 1000  # 转换为秒
-            }
-            messages.append(message_dict)
-            self.message_history.append(message_dict)
+            put(copy(sample.payload))
+            count += 1
+
+        return count
+
+    def _decode_loop(self):
+        """解码循环：将原始负载转换为消息记录，交给主线程并入历史"""
+        get = self._raw_queue.get
+        put = self._recv_queue.put
+
+        while True:
+            message_data = get()
+            try:
+                put(MsgRecord(
+                    "received",
+                    message_data.get_message_type(),
+                    message_data.to_dict(),
+                    message_data.priority,
+                    message_data.timestamp
+                ))
+            except Exception as e:
+                print(f"解码错误: {e}")
 
-        return messages
+    def _record(self, record: MsgRecord):
+        """写入消息历史（仅在主线程调用）"""
+        self.message_total += 1
+        self.message_history.append(record)
+
+    def _flush_received(self):
+        """将监控线程收到的消息并入历史（仅在主线程调用）"""
+        while not self._recv_queue.empty():
+            self._record(self._recv_queue.get_nowait())
 
     def start_monitoring(self):
         """启动后台监控"""
@@ -110,6 +207,10 @@ class InteractiveTester:
             print("📊 监控已在运行")
             return
 
+        if self._decoder_thread is None:
+            self._decoder_thread = threading.Thread(target=self._decode_loop, daemon=True)
+            self._decoder_thread.start()
+
         self.monitoring_active = True
         monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         monitor_thread.start()
@@ -120,21 +221,25 @@ class InteractiveTester:
         self.monitoring_active = False
         print("📊 后台监控已停止")
 
+    def toggle_monitoring(self):
+        """切换后台监控"""
+        if self.monitoring_active:
+            self.stop_monitoring()
+        else:
+            self.start_monitoring()
+
     def _monitoring_loop(self):
         """监控循环"""
         print("📊 监控循环启动...")
-        last_count = len(self.message_history)
 
         while self.monitoring_active:
             try:
-                messages = self.receive_messages(0.5)
-                if messages:
-                    new_count = len(self.message_history) - last_count
-                    if new_count > 0:
-                        print(f"📥 收到 {new_count} 条新消息")
-                        last_count = len(self.message_history)
-
-                time.sleep(1)
+                count = self.receive_messages()
+                if count:
+                    print(f"📥 收到 {count} 条新消息")
+
+                # 队列已取空，阻塞直到收到通知或超时
+                self.listener.timed_wait_all(MONITOR_CYCLE_TIME)
             except Exception as e:
                 print(f"监控错误: {e}")
                 break
@@ -162,213 +267,159 @@ class InteractiveTester:
     def handle_basic_messaging(self):
         """处理基础消息测试"""
         print("\n📤 基础消息测试")
-        count = int(input("发送消息数量 (1-10): ") or "3")
+        count = int(input(
+            f"发送消息数量 (1-{BASIC_MESSAGE_MAX}，超过 {BASIC_MESSAGE_MAX} 按 {BASIC_MESSAGE_MAX} 条发送): "
+        ) or "3")
+        count = max(1, min(BASIC_MESSAGE_MAX, count))
+
+        # 所有消息结构相同，复用同一个负载字典，只更新变化的字段
+        base_payload = {
+            "sequence": 0,
+            "message": "",
+            "source": "interactive_test",
+            "timestamp": 0
+        }
 
+        # 每条消息在发送前才借出样本并填充，保证时间戳是发送时刻
         for i in range(count):
-            success = self.send_message(
-                "test.basic",
-                {
-                    "sequence": i + 1,
-                    "message": f"交互式测试消息 #{i + 1}",
-                    "source": "interactive_test",
-                    "timestamp": int(time.time() * 1000)
-                }
-            )
-            if success:
-                print(f"✅ 发送消息 #{i + 1}")
-            else:
-                print(f"❌ 发送消息 #{i + 1} 失败")
+            base_payload["sequence"] = i + 1
+            base_payload["message"] = f"交互式测试消息 #{i + 1}"
+            base_payload["timestamp"] = time.time_ns() // 1_000_000
+            try:
+                sample = self.publisher.loan_uninit()
+                AmadeusMessageData.write_into(
+                    sample.payload, b"test.basic", AmadeusMessageData.encode_payload(base_payload)
+                )
+                sample.assume_init().send()
+                self.notifier.notify()
+            except Exception as e:
+                print(f"❌ 发送消息 #{i + 1} 失败: {e}")
                 break
 
-            time.sleep(0.2)
+            self._record_sent("test.basic", dict(base_payload), 1)
+            print(f"✅ 发送消息 #{i + 1}")
+
+            # 最后一条发送后无需等待
+            if i + 1 < count:
+                self.node.wait(BASIC_SEND_INTERVAL)
 
         print("基础消息测试完成")
 
+    def _menu_dispatch(self, title: str, heading: str, prompt: str, items: Dict[str, MenuItem],
+                       kind: str, default: str = "1"):
+        """显示子菜单，按选择发送对应的消息
+
+        items 为 {选项: (名称, 消息类型, 负载, 优先级)}；负载可以是字典，
+        也可以是返回字典的函数（用于需要用户输入的选项）。
+        """
+        print(f"\n{title}")
+        print(heading)
+        for key, item in items.items():
+            print(f"{key}. {item[0]}")
+
+        choice = input(f"{prompt} (1-{len(items)}): ") or default
+
+        item = items.get(choice)
+        if item is None:
+            print("❌ 无效选择")
+            return
+
+        label, msg_type, payload, priority = item
+        if callable(payload):
+            payload = payload()
+
+        if self.send_message(msg_type, payload, priority):
+            print(f"✅ 发送{kind}: {label}")
+        else:
+            print(f"❌ 发送{kind}失败")
+
     def handle_plugin_system(self):
         """处理插件系统测试"""
-        print("\n🔌 插件系统测试")
-        print("可选插件:")
-        print("1. 核心系统插件")
-        print("2. 消息示例插件")
-        print("3. 代码安全插件")
-
-        choice = input("选择插件 (1-3): ") or "1"
-
-        plugin_map = {
-            "1": ("plugin.core_system.status", "核心系统状态查询"),
-            "2": ("plugin.message_example.trigger", "消息示例插件触发"),
-            "3": ("plugin.code4rena.status", "代码安全插件状态")
-        }
+        def plugin(description):
+            return {"action": "status", "description": description, "source": "interactive_test"}
 
-        if choice in plugin_map:
-            msg_type, description = plugin_map[choice]
-            success = self.send_message(
-                msg_type,
-                {
-                    "action": "status",
-                    "description": description,
-                    "source": "interactive_test"
-                }
-            )
-            if success:
-                print(f"✅ 发送插件消息: {description}")
-            else:
-                print("❌ 发送插件消息失败")
-        else:
-            print("❌ 无效选择")
+        self._menu_dispatch("🔌 插件系统测试", "可选插件:", "选择插件", {
+            "1": ("核心系统插件", "plugin.core_system.status", plugin("核心系统状态查询"), 1),
+            "2": ("消息示例插件", "plugin.message_example.trigger", plugin("消息示例插件触发"), 1),
+            "3": ("代码安全插件", "plugin.code4rena.status", plugin("代码安全插件状态"), 1)
+        }, "插件消息")
 
     def handle_storage_operations(self):
         """处理存储操作测试"""
-        print("\n💾 存储操作测试")
-        print("可选操作:")
-        print("1. 保存数据")
-        print("2. 读取数据")
-        print("3. 删除数据")
-        print("4. 列出所有数据")
-
-        choice = input("选择操作 (1-4): ") or "1"
-
-        operations = {
-            "1": ("storage.save", {"key": "interactive_key", "value": "interactive_value"}),
-            "2": ("storage.load", {"key": "interactive_key"}),
-            "3": ("storage.delete", {"key": "interactive_key"}),
-            "4": ("storage.list", {})
-        }
-
-        if choice in operations:
-            msg_type, payload = operations[choice]
-            success = self.send_message(msg_type, payload)
-            if success:
-                print(f"✅ 发送存储操作: {msg_type}")
-            else:
-                print("❌ 发送存储操作失败")
-        else:
-            print("❌ 无效选择")
+        self._menu_dispatch("💾 存储操作测试", "可选操作:", "选择操作", {
+            "1": ("保存数据", "storage.save", {"key": "interactive_key", "value": "interactive_value"}, 1),
+            "2": ("读取数据", "storage.load", {"key": "interactive_key"}, 1),
+            "3": ("删除数据", "storage.delete", {"key": "interactive_key"}, 1),
+            "4": ("列出所有数据", "storage.list", {}, 1)
+        }, "存储操作")
 
     def handle_scheduler_operations(self):
         """处理调度操作测试"""
-        print("\n⏰ 调度操作测试")
-        print("可选操作:")
-        print("1. 添加定时任务")
-        print("2. 列出所有任务")
-        print("3. 移除任务")
-
-        choice = input("选择操作 (1-3): ") or "1"
-
-        if choice == "1":
+        def add_job():
             job_id = input("任务ID: ") or "interactive_job"
             cron = input("Cron表达式 (默认每30秒): ") or "*/30 * * * * *"
-            success = self.send_message("scheduler.add_job", {
+            return {
                 "job_id": job_id,
                 "cron": cron,
                 "message": {
                     "type": "scheduled.interactive",
                     "data": f"交互式定时任务: {job_id}"
                 }
-            })
-        elif choice == "2":
-            success = self.send_message("scheduler.list_jobs", {})
-        elif choice == "3":
-            job_id = input("要移除的任务ID: ") or "interactive_job"
-            success = self.send_message("scheduler.remove_job", {"job_id": job_id})
-        else:
-            print("❌ 无效选择")
-            return
+            }
 
-        if success:
-            print("✅ 发送调度操作成功")
-        else:
-            print("❌ 发送调度操作失败")
+        def remove_job():
+            return {"job_id": input("要移除的任务ID: ") or "interactive_job"}
+
+        self._menu_dispatch("⏰ 调度操作测试", "可选操作:", "选择操作", {
+            "1": ("添加定时任务", "scheduler.add_job", add_job, 1),
+            "2": ("列出所有任务", "scheduler.list_jobs", {}, 1),
+            "3": ("移除任务", "scheduler.remove_job", remove_job, 1)
+        }, "调度操作")
 
     def handle_monitoring_system(self):
         """处理监控系统测试"""
-        print("\n📊 监控系统测试")
-        print("可选监控:")
-        print("1. 系统健康检查")
-        print("2. 系统指标收集")
-        print("3. 性能监控")
-
-        choice = input("选择监控类型 (1-3): ") or "1"
-
-        monitor_map = {
-            "1": ("system.health_check", {"component": "all"}),
-            "2": ("system.metrics", {"include": ["cpu", "memory", "disk"]}),
-            "3": ("system.performance", {"duration": 60, "interval": 5})
-        }
-
-        if choice in monitor_map:
-            msg_type, payload = monitor_map[choice]
-            success = self.send_message(msg_type, payload)
-            if success:
-                print(f"✅ 发送监控请求: {msg_type}")
-            else:
-                print("❌ 发送监控请求失败")
-        else:
-            print("❌ 无效选择")
+        self._menu_dispatch("📊 监控系统测试", "可选监控:", "选择监控类型", {
+            "1": ("系统健康检查", "system.health_check", {"component": "all"}, 1),
+            "2": ("系统指标收集", "system.metrics", {"include": ["cpu", "memory", "disk"]}, 1),
+            "3": ("性能监控", "system.performance", {"duration": 60, "interval": 5}, 1)
+        }, "监控请求")
 
     def handle_alert_system(self):
         """处理告警系统测试"""
-        print("\n🚨 告警系统测试")
-        print("可选告警级别:")
-        print("1. 信息 (Info)")
-        print("2. 警告 (Warning)")
-        print("3. 高优先级告警 (High)")
-        print("4. 严重告警 (Critical)")
-
-        choice = input("选择告警级别 (1-4): ") or "2"
-
-        alert_map = {
-            "1": ("notification.info", "信息通知", 0),
-            "2": ("notification.warning", "警告通知", 1),
-            "3": ("alert.high", "高优先级告警", 2),
-            "4": ("alert.critical", "严重告警", 3)
-        }
-
-        if choice in alert_map:
-            msg_type, description, priority = alert_map[choice]
-            content = input("告警内容: ") or f"{description} - 交互式测试"
-
-            success = self.send_message(
-                msg_type,
-                {
+        def alert(description, priority):
+            def payload():
+                content = input("告警内容: ") or f"{description} - 交互式测试"
+                return {
                     "description": description,
                     "content": content,
                     "source": "interactive_test",
                     "severity": priority,
                     "action_required": priority >= 2
-                },
-                priority
-            )
+                }
+            return payload
 
-            if success:
-                print(f"✅ 发送告警: {description}")
-            else:
-                print("❌ 发送告警失败")
-        else:
-            print("❌ 无效选择")
+        self._menu_dispatch("🚨 告警系统测试", "可选告警级别:", "选择告警级别", {
+            "1": ("信息 (Info)", "notification.info", alert("信息通知", 0), 0),
+            "2": ("警告 (Warning)", "notification.warning", alert("警告通知", 1), 1),
+            "3": ("高优先级告警 (High)", "alert.high", alert("高优先级告警", 2), 2),
+            "4": ("严重告警 (Critical)", "alert.critical", alert("严重告警", 3), 3)
+        }, "告警", default="2")
 
     def handle_external_integration(self):
         """处理外部集成测试"""
-        print("\n🌐 外部集成测试")
-        print("可选集成:")
-        print("1. API请求模拟")
-        print("2. WebHook接收模拟")
-        print("3. 外部服务调用")
-
-        choice = input("选择集成类型 (1-3): ") or "1"
-
-        if choice == "1":
+        def api_request():
             endpoint = input("API端点 (默认/health): ") or "/health"
             method = input("HTTP方法 (默认GET): ") or "GET"
-            success = self.send_message("api.request", {
+            return {
                 "method": method,
                 "endpoint": endpoint,
                 "headers": {"User-Agent": "Amadeus-Interactive-Test/1.0"}
-            })
-        elif choice == "2":
+            }
+
+        def webhook():
             source = input("WebHook来源 (默认github): ") or "github"
             event = input("事件类型 (默认push): ") or "push"
-            success = self.send_message("webhook.incoming", {
+            return {
                 "source": source,
                 "event": event,
                 "payload": {
@@ -376,22 +427,21 @@ class InteractiveTester:
                     "ref": "refs/heads/main",
                     "action": "test"
                 }
-            })
-        elif choice == "3":
+            }
+
+        def service_call():
             service = input("外部服务名: ") or "external_service"
-            success = self.send_message("external.service_call", {
+            return {
                 "service": service,
                 "action": "status",
                 "parameters": {"test": True}
-            })
-        else:
-            print("❌ 无效选择")
-            return
+            }
 
-        if success:
-            print("✅ 发送外部集成消息成功")
-        else:
-            print("❌ 发送外部集成消息失败")
+        self._menu_dispatch("🌐 外部集成测试", "可选集成:", "选择集成类型", {
+            "1": ("API请求模拟", "api.request", api_request, 1),
+            "2": ("WebHook接收模拟", "webhook.incoming", webhook, 1),
+            "3": ("外部服务调用", "external.service_call", service_call, 1)
+        }, "外部集成消息")
 
     def handle_custom_message(self):
         """处理自定义消息发送"""
@@ -406,8 +456,9 @@ class InteractiveTester:
         payload_str = input("消息负载: ").strip()
 
         try:
-            if payload_str:
-                payload = json.loads(payload_str)
+            # 空输入和空对象无需经过解析器
+            if payload_str and payload_str != "{}":
+                payload = _json_loads(payload_str)
             else:
                 payload = {}
 
@@ -428,33 +479,33 @@ class InteractiveTester:
     def show_message_history(self):
         """显示消息历史"""
         print("\n📋 消息历史 (最近20条)")
+        self._flush_received()
 
         if not self.message_history:
             print("暂无消息历史")
             return
 
         # 显示最近20条消息
-        recent_messages = self.message_history[-20:]
+        recent_messages = islice(self.message_history, max(0, len(self.message_history) - 20), None)
 
         for i, msg in enumerate(recent_messages):
-            direction = "📤 发送" if msg["direction"] == "sent" else "📥 接收"
-            msg_type = msg["message_type"]
-            timestamp = time.strftime("%H:%M:%S", time.localtime(msg["timestamp"]))
+            direction = "📤 发送" if msg.direction == "sent" else "📥 接收"
+            msg_type = msg.message_type
+            timestamp = time.strftime("%H:%M:%S", time.localtime(msg.timestamp / 1000))
 
             print(f"{i+1:2d}. {direction} {msg_type} [{timestamp}]")
 
             # 显示关键信息
-            if "payload" in msg:
-                payload = msg["payload"]
-                if "content" in payload:
-                    content = payload["content"]
-                    if len(content) > 50:
-                        content = content[:47] + "..."
-                    print(f"      内容: {content}")
-                elif "description" in payload:
-                    print(f"      描述: {payload['description']}")
-
-        print(f"\n总共 {len(self.message_history)} 条消息")
+            payload = msg.payload
+            if "content" in payload:
+                content = payload["content"]
+                if len(content) > 50:
+                    content = content[:47] + "..."
+                print(f"      内容: {content}")
+            elif "description" in payload:
+                print(f"      描述: {payload['description']}")
+
+        print(f"\n总共 {self.message_total} 条消息")
 
     def run(self):
         """运行交互式测试器"""
@@ -472,37 +523,17 @@ class InteractiveTester:
 
                 if choice == 'q':
                     break
-                elif choice == 'h' or choice == 'help':
-                    self.show_help()
-                elif choice == '0':
-                    if self.monitoring_active:
-                        self.stop_monitoring()
-                    else:
-                        self.start_monitoring()
-                elif choice == '1':
-                    self.handle_basic_messaging()
-                elif choice == '2':
-                    self.handle_plugin_system()
-                elif choice == '3':
-                    self.handle_storage_operations()
-                elif choice == '4':
-                    self.handle_scheduler_operations()
-                elif choice == '5':
-                    self.handle_monitoring_system()
-                elif choice == '6':
-                    self.handle_alert_system()
-                elif choice == '7':
-                    self.handle_external_integration()
-                elif choice == '8':
-                    self.handle_custom_message()
-                elif choice == '9':
-                    self.show_message_history()
+
+                handler = self._dispatch.get(choice)
+                if handler is not None:
+                    handler()
                 else:
                     print("❌ 无效选择，请重新输入")
 
                 input("\n按Enter键继续...")
 
-        except KeyboardInterrupt:
+        # 在 node.wait 中按 Ctrl-C 时，iceoryx2 抛出 NodeWaitFailure
+        except (KeyboardInterrupt, iox2.NodeWaitFailure):
             print("\n🛑 收到中断信号，正在退出...")
         finally:
             self.stop_monitoring()
@@ -23,9 +23,68 @@ from amadeus_message_data import AmadeusMessageData
 # Service name used by the Rust Amadeus dispatcher
 SERVICE_NAME = "Amadeus/Message/Service"
 
+# Event service used to wake listeners after a message has been sent
+EVENT_SERVICE_NAME = SERVICE_NAME + "/Event"
+
 # Cycle time between messages
 CYCLE_TIME = iox2.Duration.from_millis(1000)
 
+# Message templates: (message type, payload, priority). The payload dicts are
+# built once; only their counter-dependent fields change per message.
+TEMPLATE_NOTIF = (
+    b"notification",
+    {
+        "title": "",
+        "message": "",
+        "level": "info"
+    },
+    1  # Normal priority
+)
+TEMPLATE_ALERT = (
+    b"alert",
+    {
+        "type": "system",
+        "severity": "warning",
+        "description": "",
+    },
+    2  # High priority
+)
+TEMPLATE_EVENT = (
+    b"custom_event",
+    {
+        "event_id": 0,
+        "source": "python_test_publisher",
+        "data": {
+            "counter": 0,
+            "status": "active",
+            "metadata": {
+                "version": "1.0",
+                "publisher": "python"
+            }
+        }
+    },
+    0  # Low priority
+)
+
+def fill_message(payload, counter: int):
+    """Write the test message for the given counter into a loaned payload."""
+    # Rotate through different message types for testing
+    if counter % 3 == 1:
+        message_type, data, priority = TEMPLATE_NOTIF
+        data["title"] = f"Test Notification #{counter}"
+        data["message"] = f"This is a test notification from Python publisher (#{counter})"
+    elif counter % 3 == 2:
+        message_type, data, priority = TEMPLATE_ALERT
+        data["description"] = f"System alert from Python publisher (#{counter})"
+    else:
+        message_type, data, priority = TEMPLATE_EVENT
+        data["event_id"] = counter
+        data["data"]["counter"] = counter
+
+    AmadeusMessageData.write_into(
+        payload, message_type, AmadeusMessageData.encode_payload(data), priority
+    )
+
 def main():
     """Main publisher function - sends test messages to Amadeus service."""
     print("=== Amadeus Iceoryx2 Publisher Test ===")
@@ -44,62 +103,35 @@ def main():
     )
     publisher = service.publisher_builder().create()
 
+    # Subscribers block on this event instead of polling
+    notifier = (
+        node.service_builder(iox2.ServiceName.new(EVENT_SERVICE_NAME))
+        .event()
+        .open_or_create()
+        .notifier_builder()
+        .create()
+    )
+
     print(f"✅ Publisher connected to service '{SERVICE_NAME}'")
     print("🚀 Starting to send messages...\n")
 
     counter = 0
     try:
+        # Loan the first sample up front
+        sample = publisher.loan_uninit()
+
         while True:
             counter += 1
+            fill_message(sample.payload, counter)
+            # Describe the payload now; a sample must not be touched once sent
+            description = f"#{counter}: {sample.payload}"
+            sample.assume_init().send()
+            notifier.notify()
 
-            # Rotate through different message types for testing
-            if counter % 3 == 1:
-                # Create notification message
-                message_data = AmadeusMessageData.from_dict(
-                    "notification",
-                    {
-                        "title": f"Test Notification #{counter}",
-                        "message": f"This is a test notification from Python publisher (#{counter})",
-                        "level": "info"
-                    },
-                    priority=1  # Normal priority
-                )
-            elif counter % 3 == 2:
-                # Create alert message with higher priority
-                message_data = AmadeusMessageData.from_dict(
-                    "alert",
-                    {
-                        "type": "system",
-                        "severity": "warning",
-                        "description": f"System alert from Python publisher (#{counter})",
-                    },
-                    priority=2  # High priority
-                )
-            else:
-                # Create custom event with metadata
-                message_data = AmadeusMessageData.from_dict(
-                    "custom_event",
-                    {
-                        "event_id": counter,
-                        "source": "python_test_publisher",
-                        "data": {
-                            "counter": counter,
-                            "status": "active",
-                            "metadata": {
-                                "version": "1.0",
-                                "publisher": "python"
-                            }
-                        }
-                    },
-                    priority=0  # Low priority
-                )
-
-            # Send message using zero-copy loan pattern
-            sample = publisher.loan_uninit()
-            sample = sample.write_payload(message_data)
-            sample.send()
+            print(f"📤 Sent message {description}")
 
-            print(f"📤 Sent message #{counter}: {message_data}")
+            # Loan the next sample now so its latency overlaps with the wait
+            sample = publisher.loan_uninit()
 
             # Rate limiting: wait before next message
             node.wait(CYCLE_TIME)
@@ -13,6 +13,8 @@
 
 """Quick test to verify iceoryx2 Python binding installation."""
 
+import sys
+
 import iceoryx2
 from amadeus_message_data import AmadeusMessageData
 
@@ -25,10 +27,10 @@ def main():
     # Test version info
     try:
         # Try to get version (might not be available)
-        version = getattr(iceoryx2, '__version__', 'unknown')
-        print(f"📦 iceoryx2 version: {version}")
-    except:
-        print("📦 iceoryx2 version: unknown")
+        version = iceoryx2.__version__
+    except AttributeError:
+        version = "unknown"
+    print(f"📦 iceoryx2 version: {version}")
 
     # Test node creation
     node = iceoryx2.NodeBuilder.new().create(iceoryx2.ServiceType.Ipc)
@@ -59,12 +61,14 @@ def main():
     subscriber = service.subscriber_builder().create()
     print("✅ Subscriber created successfully")
 
-    print("\n🎉 All tests passed! iceoryx2 Python binding is working correctly.")
-    print("\n💡 Next steps:")
-    print("1. Start the Rust Amadeus application: cargo run --example messaging")
-    print("2. Run publisher in one terminal: python3 publisher.py")
-    print("3. Run subscriber in another terminal: python3 subscriber.py")
-    print("4. Or run integration test: python3 test_integration.py")
+    sys.stdout.write(
+        "\n🎉 All tests passed! iceoryx2 Python binding is working correctly.\n"
+        "\n💡 Next steps:\n"
+        "1. Start the Rust Amadeus application: cargo run --example messaging\n"
+        "2. Run publisher in one terminal: python3 publisher.py\n"
+        "3. Run subscriber in another terminal: python3 subscriber.py\n"
+        "4. Or run integration test: python3 test_integration.py\n"
+    )
 
 if __name__ == "__main__":
     main()
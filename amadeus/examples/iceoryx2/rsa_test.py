@@ -10,9 +10,9 @@ from Amadeus by providing an RSA public key.
 
 import sys
 import os
-import glob
+import platform
 import time
-import base64
+import binascii
 import json
 
 # Try to import iceoryx2, if failing, try to find it in the project venv
@@ -22,12 +22,17 @@ except ImportError:
     # Try to find the venv created by run_test.sh
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.abspath(os.path.join(script_dir, "../../.."))
-    venv_path = os.path.join(project_root, "iceoryx2/iceoryx2-ffi/python/venv/lib/python3.*/site-packages")
-    
-    found_paths = glob.glob(venv_path)
-    if found_paths:
+    # Only a venv built for this interpreter version can hold a usable binding
+    venv_site = os.path.join(
+        project_root,
+        "iceoryx2/iceoryx2-ffi/python/venv/lib",
+        f"python{sys.version_info.major}.{sys.version_info.minor}",
+        "site-packages"
+    )
+
+    if os.path.isdir(venv_site):
         import site
-        site.addsitedir(found_paths[0])
+        site.addsitedir(venv_site)
         try:
             import iceoryx2 as iox2
         except ImportError:
@@ -42,21 +47,101 @@ except ImportError:
 from amadeus_message_data import AmadeusMessageData
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
 SERVICE_NAME = "Amadeus/Message/Service"
 CYCLE_TIME = iox2.Duration.from_millis(100)
 
 
+# Length of the authentication tag appended to AES-GCM ciphertext
+GCM_TAG_SIZE = 16
+
+
+def aes_gcm_decrypt(key: bytes, iv: bytes, data: bytes) -> bytes:
+    """Decrypt AES-GCM data whose authentication tag is appended to the ciphertext.
+
+    Uses the low-level Cipher API so OpenSSL's AES-NI/PCLMULQDQ path is
+    driven directly, without the per-call setup of the AESGCM wrapper.
+    """
+    # Slice through a memoryview so the ciphertext is not copied
+    view = memoryview(data)
+    ciphertext, tag = view[:-GCM_TAG_SIZE], bytes(view[-GCM_TAG_SIZE:])
+    decryptor = Cipher(algorithms.AES(key), modes.GCM(iv, tag)).decryptor()
+    return decryptor.update(ciphertext) + decryptor.finalize()
+
+
+def has_clmul() -> bool:
+    """Report whether the CPU offers carry-less multiply for hardware GHASH.
+
+    Only x86 is checked, by reading the flags in /proc/cpuinfo. Returns True
+    on other architectures or when the flags cannot be read, so no warning
+    is printed.
+    """
+    if platform.machine().lower() not in ('x86_64', 'amd64', 'i386', 'i686', 'x86'):
+        return True
+    try:
+        with open('/proc/cpuinfo') as f:
+            flags = next(
+                (line.split(':', 1)[1].split() for line in f if line.startswith('flags')),
+                None,
+            )
+    except OSError:
+        return True
+    if flags is None:
+        return True
+    return 'pclmulqdq' in flags
+
+
+# Kept next to this script, where .gitignore covers it, whatever the working directory
+PRIVATE_KEY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "private_key.pem")
+
+
 def generate_keys():
-    """Generate RSA key pair and save public key to file."""
-    print("🔑 Generating RSA Key Pair...")
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-        backend=default_backend()
-    )
+    """Load or generate RSA key pair and save public key to file.
+
+    The private key is persisted on first run so later runs skip the costly
+    prime search and just deserialize the PEM.
+    """
+    if os.path.exists(PRIVATE_KEY_PATH):
+        print(f"🔑 Loading RSA private key from '{PRIVATE_KEY_PATH}'...")
+        with open(PRIVATE_KEY_PATH, "rb") as f:
+            private_key = serialization.load_pem_private_key(
+                f.read(),
+                password=None,
+                backend=default_backend()
+            )
+    else:
+        print("🔑 Generating RSA Key Pair...")
+        private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+            backend=default_backend()
+        )
+
+        private_pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+        # Owner-only permissions: this is an unencrypted private key
+        fd = os.open(PRIVATE_KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(private_pem)
+        print(f"✅ Private key saved to '{PRIVATE_KEY_PATH}'")
     
     public_key = private_key.public_key()
     
@@ -76,6 +161,11 @@ def main():
     
     # 1. Generate Keys
     private_key = generate_keys()
+
+    # The dispatcher only speaks AES-GCM, so without CLMUL there is no faster
+    # mode to negotiate; just make the slower software GHASH path visible.
+    if not has_clmul():
+        print("⚠️ CPU lacks PCLMULQDQ: AES-GCM will use software GHASH and decrypt slowly")
     
     print(f"\n🚀 Connecting to service: {SERVICE_NAME}")
     
@@ -89,6 +179,10 @@ def main():
     )
     subscriber = service.subscriber_builder().create()
     
+    # The envelope is JSON text, so binary fields must stay base64. Decoding
+    # the str fields directly skips b64decode's extra str -> bytes copy.
+    b64decode = binascii.a2b_base64
+
     print("👂 Listening for encrypted messages...")
     print("   (Ensure the Rust application is running with 'public_key.pem' configured)")
     
@@ -109,37 +203,33 @@ def main():
                         
                         try:
                             # 1. Decode fields
-                            encrypted_key = base64.b64decode(payload_dict["secure_key"])
-                            iv = base64.b64decode(payload_dict["iv"])
-                            encrypted_payload = base64.b64decode(payload_dict["secure_payload"])
+                            encrypted_key = b64decode(payload_dict["secure_key"])
+                            iv = b64decode(payload_dict["iv"])
+                            encrypted_payload = b64decode(payload_dict["secure_payload"])
                             
                             # 2. Decrypt AES Key with RSA
-                            aes_key = private_key.decrypt(
-                                encrypted_key,
-                                padding.PKCS1v15()
-                            )
+                            aes_key = private_key.decrypt(encrypted_key, padding.PKCS1v15())
                             
                             # 3. Decrypt Payload with AES-GCM
-                            aesgcm = AESGCM(aes_key)
-                            decrypted_data = aesgcm.decrypt(iv, encrypted_payload, None)
+                            decrypted_data = aes_gcm_decrypt(aes_key, iv, encrypted_payload)
                             
-                            decrypted_json = json.loads(decrypted_data.decode('utf-8'))
-                            print(f"🔓 Decrypted Content: {json.dumps(decrypted_json, indent=2, ensure_ascii=False)}")
+                            decrypted_json = _json_loads(decrypted_data)
+                            print(f"🔓 Decrypted Content: {_json_pretty(decrypted_json)}")
                         except Exception as e:
                             print(f"❌ Decryption Failed: {e}")
                     elif "secure_payload" in payload_dict:
                          # Old RSA-only fallback (though Rust side changed, good to keep logic safe)
                         print(f"\n🔐 Received Legacy RSA Message!")
                         encrypted_b64 = payload_dict["secure_payload"]
-                        encrypted_bytes = base64.b64decode(encrypted_b64)
+                        encrypted_bytes = b64decode(encrypted_b64)
                         
                         try:
                             decrypted_data = private_key.decrypt(
                                 encrypted_bytes,
                                 padding.PKCS1v15()
                             )
-                            decrypted_json = json.loads(decrypted_data.decode('utf-8'))
-                            print(f"🔓 Decrypted Content: {json.dumps(decrypted_json, indent=2, ensure_ascii=False)}")
+                            decrypted_json = _json_loads(decrypted_data)
+                            print(f"🔓 Decrypted Content: {_json_pretty(decrypted_json)}")
                         except Exception as e:
                             print(f"❌ Decryption Failed: {e}")
                     else:
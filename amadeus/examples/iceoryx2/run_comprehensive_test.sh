@@ -299,7 +299,7 @@ main() {
     echo
     echo "如需查看详细日志，请设置环境变量:"
     echo "export RUST_LOG=debug"
-    echo "export ICEORYX2_LOG_LEVEL=debug"
+    echo "export IOX2_LOG_LEVEL=debug"
 }
 
 # 运行主函数
@@ -11,7 +11,6 @@ by sending a specific message over Iceoryx2.
 
 import sys
 import os
-import glob
 
 # Try to import iceoryx2, if failing, try to find it in the project venv
 try:
@@ -20,12 +19,17 @@ except ImportError:
     # Try to find the venv created by run_test.sh
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.abspath(os.path.join(script_dir, "../../.."))
-    venv_path = os.path.join(project_root, "iceoryx2/iceoryx2-ffi/python/venv/lib/python3.*/site-packages")
-    
-    found_paths = glob.glob(venv_path)
-    if found_paths:
+    # Only a venv built for this interpreter version can hold a usable binding
+    venv_site = os.path.join(
+        project_root,
+        "iceoryx2/iceoryx2-ffi/python/venv/lib",
+        f"python{sys.version_info.major}.{sys.version_info.minor}",
+        "site-packages"
+    )
+
+    if os.path.isdir(venv_site):
         import site
-        site.addsitedir(found_paths[0])
+        site.addsitedir(venv_site)
         try:
             import iceoryx2 as iox2
         except ImportError:
@@ -38,12 +42,26 @@ except ImportError:
         sys.exit(1)
 
 from amadeus_message_data import AmadeusMessageData
-import json
 import time
 
 # Service name used by the Rust Amadeus dispatcher
 SERVICE_NAME = "Amadeus/Message/Service"
 
+# Message types understood by the Amadeus core system, encoded once
+SCHEDULE_ADD_TYPE = b"system.schedule.add"
+MEMO_CREATE_TYPE = b"system.memo.create"
+
+def publish(publisher, message_type: bytes, payload: dict, priority: int = 1):
+    """Build a message directly in a loaned sample and send it."""
+    sample = publisher.loan_uninit()
+    AmadeusMessageData.write_into(
+        sample.payload,
+        message_type,
+        AmadeusMessageData.encode_payload(payload),
+        priority
+    )
+    sample.assume_init().send()
+
 def main():
     print("=== Amadeus Scheduler Test Client ===")
     print(f"Connecting to service: {SERVICE_NAME}")
@@ -80,15 +98,12 @@ def main():
     }
 
     print("\n📤 Sending schedule request...")
-    message_data = AmadeusMessageData.from_dict(
-        "system.schedule.add",  # Topic for adding schedules
+    publish(
+        publisher,
+        SCHEDULE_ADD_TYPE,  # Topic for adding schedules
         schedule_payload,
         priority=1
     )
-
-    sample = publisher.loan_uninit()
-    sample = sample.write_payload(message_data)
-    sample.send()
     
     print(f"✅ Schedule request sent: {schedule_payload}")
     
@@ -101,15 +116,12 @@ def main():
         "priority": 1
     }
     
-    message_data = AmadeusMessageData.from_dict(
-        "system.memo.create",
+    publish(
+        publisher,
+        MEMO_CREATE_TYPE,
         todo_payload,
         priority=1
     )
-    
-    sample = publisher.loan_uninit()
-    sample = sample.write_payload(message_data)
-    sample.send()
     print(f"✅ TODO creation request sent: {todo_payload}")
 
     print("\nTasks submitted. Check Amadeus logs for execution.")
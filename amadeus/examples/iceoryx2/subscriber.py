@@ -15,71 +15,131 @@
 
 This script receives messages from the Amadeus iceoryx2 service that the Rust
 dispatcher publishes.
+
+Per-message output is logged at DEBUG level; at the default INFO level only a
+periodic message count is shown. Set AMADEUS_LOG_LEVEL=DEBUG to see every
+message.
+
+iceoryx2's own logging defaults to Warn; override it with IOX2_LOG_LEVEL
+(e.g. IOX2_LOG_LEVEL=Info).
 """
 
+import json
+import logging
+import os
+import time
+
 import iceoryx2 as iox2
 from amadeus_message_data import AmadeusMessageData
 
+try:
+    import orjson
+
+    def _json_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _json_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+logger = logging.getLogger(__name__)
+
 # Service name used by the Rust Amadeus dispatcher
 SERVICE_NAME = "Amadeus/Message/Service"
 
-# Cycle time for receiving messages
+# Event service notified by Python publishers after sending
+EVENT_SERVICE_NAME = SERVICE_NAME + "/Event"
+
+# Longest wait for a notification; the Rust dispatcher does not notify, so
+# its messages are still picked up at this interval
 CYCLE_TIME = iox2.Duration.from_millis(100)
 
+# Minimum time between two INFO-level progress lines
+PROGRESS_INTERVAL_NS = 1_000_000_000
+
 def main():
     """Main subscriber function - receives and displays messages from Amadeus service."""
     print("=== Amadeus Iceoryx2 Subscriber Test ===")
     print(f"Connecting to service: {SERVICE_NAME}")
     print("Press Ctrl+C to stop\n")
 
-    # Set up iceoryx2 node and service
-    iox2.set_log_level_from_env_or(iox2.LogLevel.Info)
-    node = iox2.NodeBuilder.new().create(iox2.ServiceType.Ipc)
-
-    # Open or create publish-subscribe service
-    service = (
-        node.service_builder(iox2.ServiceName.new(SERVICE_NAME))
-        .publish_subscribe(AmadeusMessageData)
-        .open_or_create()
+    logging.basicConfig(
+        level=os.environ.get("AMADEUS_LOG_LEVEL", "INFO").upper(),
+        format="%(message)s"
     )
-    subscriber = service.subscriber_builder().create()
-
-    print(f"✅ Subscriber connected to service '{SERVICE_NAME}'")
-    print("👂 Listening for messages...\n")
 
     message_count = 0
 
+    # Interrupts and errors are handled once around the whole run
     try:
+        # Set up iceoryx2 node and service
+        iox2.set_log_level_from_env_or(iox2.LogLevel.Warn)
+        node = iox2.NodeBuilder.new().create(iox2.ServiceType.Ipc)
+
+        # Open or create publish-subscribe service
+        service = (
+            node.service_builder(iox2.ServiceName.new(SERVICE_NAME))
+            .publish_subscribe(AmadeusMessageData)
+            .open_or_create()
+        )
+        subscriber = service.subscriber_builder().create()
+        listener = (
+            node.service_builder(iox2.ServiceName.new(EVENT_SERVICE_NAME))
+            .event()
+            .open_or_create()
+            .listener_builder()
+            .create()
+        )
+
+        print(f"✅ Subscriber connected to service '{SERVICE_NAME}'")
+        print("👂 Listening for messages...\n")
+
+        receive = subscriber.receive
+        copy = AmadeusMessageData.from_buffer_copy
+        verbose = logger.isEnabledFor(logging.DEBUG)
+        monotonic_ns = time.monotonic_ns
+        # Start one interval back so the first messages are reported immediately
+        last_progress = monotonic_ns() - PROGRESS_INTERVAL_NS
+
         while True:
-            # Poll for messages at regular intervals
-            node.wait(CYCLE_TIME)
+            # Sleep until a publisher notifies, or the cycle time elapses
+            listener.timed_wait_all(CYCLE_TIME)
 
-            # Process all available messages in queue
+            # Drain the whole queue first, copying each payload so the sample
+            # is returned immediately; printing happens afterwards
+            received = []
             while True:
-                sample = subscriber.receive()
+                sample = receive()
                 if sample is None:
                     break  # No more messages available
-
+                received.append(copy(sample.payload))
+
+            if not verbose:
+                # Only count; formatting is skipped entirely
+                message_count += len(received)
+                now = monotonic_ns()
+                if received and now - last_progress >= PROGRESS_INTERVAL_NS:
+                    logger.info("📥 Received %d messages", message_count)
+                    last_progress = now
+                continue
+
+            for message_data in received:
                 message_count += 1
-                message_data = sample.payload
-
-                print(f"📥 Received message #{message_count}:")
-                print(f"   {message_data}")
 
-                # Parse and pretty-print JSON payload
-                try:
-                    import json
-                    payload_dict = message_data.to_dict()
-                    print(f"   📋 Content: {json.dumps(payload_dict, indent=2, ensure_ascii=False)}")
-                except Exception as e:
-                    print(f"   ⚠️  Could not parse JSON: {e}")
+                logger.debug("📥 Received message #%d:", message_count)
+                logger.debug("   %s", message_data)
 
-                print()
+                # Pretty-print JSON payload; to_dict reports invalid JSON itself
+                logger.debug("   📋 Content: %s\n", _json_pretty(message_data.to_dict()))
 
     except KeyboardInterrupt:
         print(f"\n🛑 Subscriber stopped by user (received {message_count} messages)")
-    except iox2.NodeWaitFailure:
-        print(f"\n❌ Node wait failure - exiting (received {message_count} messages)")
+    except iox2.ListenerWaitError as e:
+        # Ctrl-C during the listener wait surfaces as an InterruptSignal
+        # wait error; any other wait error is a real failure
+        if "Interrupt" not in str(e):
+            print(f"\n❌ Listener wait failure: {e}")
+            return 1
+        print(f"\n🛑 Subscriber stopped by user (received {message_count} messages)")
     except Exception as e:
         print(f"\n❌ Error: {e}")
         return 1
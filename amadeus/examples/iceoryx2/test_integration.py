@@ -14,11 +14,22 @@
 """Integration test for Amadeus iceoryx2 dispatcher communication.
 
 This script tests the interaction between Python iceoryx2 clients and the
-Rust Amadeus dispatcher by running both publisher and subscriber in the
-same process.
+Rust Amadeus dispatcher by running both publisher and subscriber as
+coroutines on one asyncio event loop in the same process.
+
+Received messages are logged at DEBUG level after each drain of the queue;
+at the default INFO level the subscriber only reports how many messages
+arrived. Set AMADEUS_LOG_LEVEL=DEBUG to see each message.
+
+Set AMADEUS_BENCH=1 for a stress run: the publisher sends as fast as the event
+loop allows, with a bare counter as content and no per-message output. At
+DEBUG level the subscriber then keeps the details of the most recent messages
+in a fixed-size buffer and logs them once the run ends.
 """
 
-import threading
+import asyncio
+import logging
+import os
 import time
 import iceoryx2 as iox2
 from amadeus_message_data import AmadeusMessageData
@@ -26,13 +37,45 @@ from amadeus_message_data import AmadeusMessageData
 # Service name used by the Rust Amadeus dispatcher
 SERVICE_NAME = "Amadeus/Message/Service"
 
-def run_publisher(test_duration: int = 10):
-    """Run publisher thread that sends test messages for specified duration."""
-    print("🚀 Starting Python Publisher...")
+logger = logging.getLogger(__name__)
 
-    # Set up iceoryx2 with reduced logging for cleaner output
-    iox2.set_log_level_from_env_or(iox2.LogLevel.Warn)
-    node = iox2.NodeBuilder.new().create(iox2.ServiceType.Ipc)
+# Event service the publisher notifies after each send
+EVENT_SERVICE_NAME = SERVICE_NAME + "/Event"
+
+# Longest time to wait for the subscriber to attach before publishing anyway
+SUBSCRIBER_READY_TIMEOUT = 5.0
+
+# Longest time the subscriber waits for a notification before polling anyway
+POLL_INTERVAL = iox2.Duration.from_millis(100)
+
+# Message type sent by the Python publisher, encoded once
+TEST_MESSAGE_TYPE = b"python_test"
+
+# Stress mode: no rate limit, no content formatting, no per-message output
+BENCH_MODE = os.environ.get("AMADEUS_BENCH") == "1"
+
+# Delay between two published messages (2 messages per second normally)
+PUBLISH_INTERVAL = 0 if BENCH_MODE else 0.5
+
+# Received-message details kept in stress mode for the DEBUG report printed at
+# the end; once full, the oldest entries are overwritten
+EVENT_BUFFER_SIZE = 100_000
+
+def log_received(number: int, msg_type: str, priority: str, parsed: bool, source, content):
+    """Log the details of one received message at DEBUG level."""
+    logger.debug("📥 Python received #%d: %s (%s)", number, msg_type, priority)
+    if parsed:
+        logger.debug("   From: %s", source)
+        logger.debug("   Content: %s", content)
+    else:
+        logger.debug("   (Could not parse content)")
+
+async def run_publisher(node, test_duration: int = 10, ready: asyncio.Event = None):
+    """Run publisher coroutine that sends test messages for specified duration.
+
+    If ``ready`` is given, publishing starts once the subscriber has set it.
+    """
+    print("🚀 Starting Python Publisher...")
 
     # Connect to shared service
     service = (
@@ -41,48 +84,75 @@ def run_publisher(test_duration: int = 10):
         .open_or_create()
     )
     publisher = service.publisher_builder().create()
+    notifier = (
+        node.service_builder(iox2.ServiceName.new(EVENT_SERVICE_NAME))
+        .event()
+        .open_or_create()
+        .notifier_builder()
+        .create()
+    )
 
     print("✅ Python Publisher connected")
 
-    start_time = time.time()
+    if ready is not None:
+        try:
+            await asyncio.wait_for(ready.wait(), SUBSCRIBER_READY_TIMEOUT)
+        except asyncio.TimeoutError:
+            print("⚠️ Subscriber not ready, publishing anyway")
+
+    deadline = time.monotonic() + test_duration
     counter = 0
 
+    # Every message has the same shape; only the changing fields are updated
+    template = {
+        "message_id": 0,
+        "source": "python_integration_test",
+        "content": "",
+        "timestamp": 0
+    }
+
+    loan_uninit = publisher.loan_uninit
+    notify = notifier.notify
+    write_into = AmadeusMessageData.write_into
+    encode_payload = AmadeusMessageData.encode_payload
+
     try:
-        while time.time() - start_time < test_duration:
+        while time.monotonic() < deadline:
             counter += 1
 
             # Create structured test message with metadata
-            message_data = AmadeusMessageData.from_dict(
-                "python_test",
-                {
-                    "message_id": counter,
-                    "source": "python_integration_test",
-                    "content": f"Test message #{counter} from Python publisher",
-                    "timestamp": int(time.time() * 1000)
-                },
-                priority=1  # Normal priority
+            template["message_id"] = counter
+            template["content"] = counter if BENCH_MODE else f"Test message #{counter} from Python publisher"
+            template["timestamp"] = time.time_ns() // 1_000_000
+
+            # Zero-copy loan pattern: build the message directly in the
+            # loaned shared-memory slot, then publish it
+            sample = loan_uninit()
+            write_into(
+                sample.payload,
+                TEST_MESSAGE_TYPE,
+                encode_payload(template),
+                1  # Normal priority
             )
+            sample.assume_init().send()
+            notify()
 
-            # Send via zero-copy loan pattern
-            sample = publisher.loan_uninit()
-            sample = sample.write_payload(message_data)
-            sample.send()
-
-            print(f"📤 Python sent: #{counter}")
-            time.sleep(0.5)  # Rate limit: 2 messages per second
+            if not BENCH_MODE:
+                print(f"📤 Python sent: #{counter}")
+            # Rate limit; in bench mode this only yields to the subscriber
+            await asyncio.sleep(PUBLISH_INTERVAL)
 
     except Exception as e:
         print(f"❌ Publisher error: {e}")
 
-    print("🛑 Python Publisher finished")
+    print(f"🛑 Python Publisher finished (sent {counter} messages)")
 
-def run_subscriber(test_duration: int = 10):
-    """Run subscriber thread that receives and displays messages for specified duration."""
-    print("👂 Starting Python Subscriber...")
+async def run_subscriber(node, test_duration: int = 10, ready: asyncio.Event = None):
+    """Run subscriber coroutine that receives and displays messages for specified duration.
 
-    # Set up iceoryx2 with reduced logging
-    iox2.set_log_level_from_env_or(iox2.LogLevel.Warn)
-    node = iox2.NodeBuilder.new().create(iox2.ServiceType.Ipc)
+    ``ready``, if given, is set as soon as the subscriber is attached.
+    """
+    print("👂 Starting Python Subscriber...")
 
     # Connect to shared service
     service = (
@@ -91,50 +161,109 @@ def run_subscriber(test_duration: int = 10):
         .open_or_create()
     )
     subscriber = service.subscriber_builder().create()
+    listener = (
+        node.service_builder(iox2.ServiceName.new(EVENT_SERVICE_NAME))
+        .event()
+        .open_or_create()
+        .listener_builder()
+        .create()
+    )
 
     print("✅ Python Subscriber connected")
+    if ready is not None:
+        ready.set()
 
-    start_time = time.time()
+    deadline = time.monotonic() + test_duration
     message_count = 0
+    loop = asyncio.get_running_loop()
+    receive = subscriber.receive
+    copy = AmadeusMessageData.from_buffer_copy
+    verbose = logger.isEnabledFor(logging.DEBUG)
+    # In stress mode logging every drain would throttle it, so the details go
+    # into a ring buffer of (number, type, priority, parsed, source, content)
+    # that is logged after the loop
+    events = [None] * EVENT_BUFFER_SIZE if verbose and BENCH_MODE else None
 
     try:
-        while time.time() - start_time < test_duration:
-            time.sleep(0.1)  # Poll interval: check every 100ms
-
-            # Drain all available messages from queue
+        while time.monotonic() < deadline:
+            # Wake on the publisher's notification, or poll every 100ms
+            # for messages from the Rust dispatcher, which does not notify.
+            # The wait blocks, so it runs in the executor to keep the event
+            # loop (and the publisher) running meanwhile.
+            await loop.run_in_executor(None, listener.timed_wait_all, POLL_INTERVAL)
+
+            # Drain all available messages from queue before printing any
+            received = []
             while True:
-                sample = subscriber.receive()
+                sample = receive()
                 if sample is None:
                     break  # Queue empty
-
+                received.append(copy(sample.payload))
+
+            if not verbose:
+                if received:
+                    message_count += len(received)
+                    logger.info("📥 Python received %d messages", message_count)
+                continue
+
+            for message_data in received:
+                # Parse message content. to_dict never raises (bad JSON comes
+                # back as an error dict), but a valid payload need not be an
+                # object
+                payload_dict = message_data.to_dict()
+                parsed = isinstance(payload_dict, dict)
+                event = (
+                    message_count + 1,
+                    message_data.get_message_type(),
+                    message_data.get_priority_name(),
+                    parsed,
+                    payload_dict.get('source', 'unknown') if parsed else None,
+                    payload_dict.get('content', 'N/A') if parsed else None
+                )
+                if events is None:
+                    log_received(*event)
+                else:
+                    events[message_count % EVENT_BUFFER_SIZE] = event
                 message_count += 1
-                message_data = sample.payload
-
-                # Extract and display key message details
-                msg_type = message_data.get_message_type()
-                priority = message_data.get_priority_name()
-
-                print(f"📥 Python received #{message_count}: {msg_type} ({priority})")
-
-                # Parse and display message content
-                try:
-                    payload_dict = message_data.to_dict()
-                    content = payload_dict.get('content', 'N/A')
-                    source = payload_dict.get('source', 'unknown')
-                    print(f"   From: {source}")
-                    print(f"   Content: {content}")
-                except:
-                    print("   (Could not parse content)")
     except Exception as e:
         print(f"❌ Subscriber error: {e}")
 
+    if events is not None and message_count:
+        # Oldest retained entry first
+        start = message_count % EVENT_BUFFER_SIZE if message_count > EVENT_BUFFER_SIZE else 0
+        retained = min(message_count, EVENT_BUFFER_SIZE)
+        if retained < message_count:
+            logger.debug("(showing the last %d of %d messages)", retained, message_count)
+        for i in range(retained):
+            log_received(*events[(start + i) % EVENT_BUFFER_SIZE])
+
     print(f"🛑 Python Subscriber finished (received {message_count} messages)")
 
+async def run_integration(test_duration: int):
+    """Run subscriber and publisher concurrently until both finish."""
+    # Set up iceoryx2 with reduced logging for cleaner output. Both sides
+    # share one node; a node can own any number of ports.
+    iox2.set_log_level_from_env_or(iox2.LogLevel.Warn)
+    node = iox2.NodeBuilder.new().create(iox2.ServiceType.Ipc)
+
+    # The publisher waits until the subscriber is attached so no early
+    # message is missed
+    ready = asyncio.Event()
+    await asyncio.gather(
+        run_subscriber(node, test_duration, ready),
+        run_publisher(node, test_duration, ready)
+    )
+
 def main():
     print("=== Amadeus Iceoryx2 Integration Test ===")
     print("Testing Python ↔ Rust iceoryx2 communication")
     print()
 
+    logging.basicConfig(
+        level=os.environ.get("AMADEUS_LOG_LEVEL", "INFO").upper(),
+        format="%(message)s"
+    )
+
     # Test duration in seconds
     TEST_DURATION = 15
 
@@ -143,20 +272,7 @@ def main():
     print("Example: cargo run --example messaging")
     print()
 
-    # Start subscriber thread
-    subscriber_thread = threading.Thread(target=run_subscriber, args=(TEST_DURATION,))
-    subscriber_thread.start()
-
-    # Wait a bit for subscriber to be ready
-    time.sleep(1)
-
-    # Start publisher thread
-    publisher_thread = threading.Thread(target=run_publisher, args=(TEST_DURATION,))
-    publisher_thread.start()
-
-    # Wait for both threads to complete
-    publisher_thread.join()
-    subscriber_thread.join()
+    asyncio.run(run_integration(TEST_DURATION))
 
     print()
     print("✅ Integration test completed!")